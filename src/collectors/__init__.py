@@ -1,10 +1,13 @@
 """Data collectors for various systems."""
 from .base import BaseCollector, ServiceData
-from .wid_collector import WIDCollector, get_service_from_wid
+from .wid_collector import WIDCollector, WIDDriverPool, get_service_from_wid
+from .wid_http_collector import WIDHttpCollector
 
 __all__ = [
     "BaseCollector",
-    "ServiceData", 
+    "ServiceData",
     "WIDCollector",
+    "WIDDriverPool",
+    "WIDHttpCollector",
     "get_service_from_wid",
 ]
@@ -4,9 +4,19 @@ Scrapes service data from the PrimeFaces web interface.
 """
 
 from typing import List, Optional, Dict, Any
+from collections import OrderedDict
 from datetime import datetime
-import time
+import atexit
+import os
+import pickle
+import queue
 import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import urllib3
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -15,15 +25,83 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    InvalidSelectorException,
+    InvalidSessionIdException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from webdriver_manager.chrome import ChromeDriverManager
 from loguru import logger
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
 
 from .base import BaseCollector, ServiceData
 from ..config.settings import get_settings
 
 
+# Strips everything but digits when coercing numeric WID values
+_DIGITS_RE = re.compile(r"[^\d]")
+
+# ServiceData fields that carry integers (bandwidth, VLAN ids)
+_NUMERIC_FIELDS = frozenset({
+    "bandwidth",
+    "cpe_management_vlan",
+    "cpe_interface_vlan",
+    "bvi_vlan",
+})
+
+def _build_service_data(
+    service_id: str,
+    raw_data: Dict[str, Any],
+    field_map: Dict[str, str],
+    collected_at: Optional[datetime] = None,
+) -> ServiceData:
+    """
+    Map raw WID label/value pairs to a standardized ServiceData.
+
+    Pure function of the extracted data and a label -> field mapping, shared
+    by the Selenium and HTTP collectors.
+    """
+    # Bulk callers pass one timestamp per batch instead of hitting the
+    # clock for every instance
+    if collected_at is None:
+        collected_at = datetime.now()
+
+    data = ServiceData(
+        service_id=service_id,
+        source_system="WID",
+        collected_at=collected_at,
+        raw_data=raw_data
+    )
+
+    # Iterate the extracted attributes and dict-lookup the target field,
+    # so cost scales with the page's rows rather than the full mapping
+    for wid_field, value in raw_data.items():
+        service_field = field_map.get(wid_field)
+        if not service_field:
+            continue
+
+        # Type conversion for numeric fields
+        if service_field in _NUMERIC_FIELDS:
+            try:
+                value = int(_DIGITS_RE.sub("", str(value)))
+            except ValueError:
+                value = None
+
+        setattr(data, service_field, value)
+
+    return data
+
+
+# In-memory tier of the search cache: service_id -> (stored_at, ServiceData),
+# LRU-bounded so long bulk runs can't grow it without limit
+_MEM_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_MEM_CACHE_MAXSIZE = 1024
+_MEM_CACHE_LOCK = threading.Lock()
+
+
 class WIDCollector(BaseCollector):
     """
     Collector for WID (Web Ingeniería) system.
@@ -87,7 +165,22 @@ class WIDCollector(BaseCollector):
         "IP WAN AGGI - INT": "wan_aggi_ip",
         "MASCARA DE RED WAN IPV4": "wan_mask",
     }
+
+    # Hot-path view of FIELD_MAPPING without the None entries, which exist
+    # only to document known-but-unmapped WID labels
+    _FIELD_MAP_ACTIVE = {k: v for k, v in FIELD_MAPPING.items() if v is not None}
     
+    # Shared instance for driver reuse across calls (see get_shared)
+    _shared_instance: Optional["WIDCollector"] = None
+    _shared_lock = threading.Lock()
+
+    # Resolved chromedriver path, cached so only the first connect() pays
+    # for the webdriver-manager version check (a network roundtrip)
+    _driver_path: Optional[str] = None
+    _driver_path_file = os.path.join(
+        os.path.expanduser("~"), ".cache", "automate", "chromedriver_path"
+    )
+
     def __init__(self, headless: bool = None):
         """Initialize WID collector."""
         super().__init__()
@@ -95,11 +188,70 @@ class WIDCollector(BaseCollector):
         self.headless = headless if headless is not None else get_settings().headless_browser
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
+
+    @classmethod
+    def get_shared(cls, headless: bool = None) -> "WIDCollector":
+        """
+        Get a shared, already-authenticated collector instance.
+
+        Keeps one Chrome session alive across calls so repeat queries only
+        pay for the search+extract path, not browser startup and login.
+        The browser is closed automatically at interpreter exit.
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                instance = cls(headless=headless)
+                cls._shared_instance = instance
+                atexit.register(instance.disconnect)
+            cls._shared_instance._ensure_alive()
+            return cls._shared_instance
+
+    def _ensure_alive(self) -> None:
+        """Reconnect if the browser session died or was never started."""
+        if self.driver is not None:
+            try:
+                _ = self.driver.current_url  # Cheap probe of the session
+                return
+            except (InvalidSessionIdException, WebDriverException):
+                logger.warning("WID browser session is dead - reconnecting")
+                self.disconnect()
+        self.connect()
     
+    @classmethod
+    def _get_driver_path(cls) -> str:
+        """Resolve the chromedriver binary path, cached across connects."""
+        if cls._driver_path and os.path.exists(cls._driver_path):
+            return cls._driver_path
+
+        # Try the on-disk cache from a previous run
+        try:
+            with open(cls._driver_path_file) as f:
+                cached = f.read().strip()
+            if cached and os.path.exists(cached):
+                cls._driver_path = cached
+                return cached
+        except OSError:
+            pass
+
+        # Fall back to webdriver-manager (network version check + download)
+        cls._driver_path = ChromeDriverManager().install()
+        try:
+            os.makedirs(os.path.dirname(cls._driver_path_file), exist_ok=True)
+            with open(cls._driver_path_file, "w") as f:
+                f.write(cls._driver_path)
+        except OSError as e:
+            logger.debug(f"Could not persist chromedriver path: {e}")
+
+        return cls._driver_path
+
     def _setup_driver(self) -> webdriver.Chrome:
         """Configure and create Chrome WebDriver."""
         options = Options()
-        
+
+        # Return from navigations on DOMContentLoaded instead of the full
+        # load event - the explicit waits cover the elements we actually need
+        options.page_load_strategy = "eager"
+
         if self.headless:
             options.add_argument("--headless=new")
         
@@ -109,18 +261,47 @@ class WIDCollector(BaseCollector):
         options.add_argument("--window-size=1920,1080")
         options.add_argument("--disable-notifications")
         options.add_argument("--disable-popup-blocking")
+
+        # Skip images and webfonts - we only scrape table text. Stylesheets
+        # stay enabled because visibility waits depend on the PrimeFaces CSS.
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
         
         # Avoid detection
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
         
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        
+        service = Service(self._get_driver_path())
+        # keep_alive reuses one TCP connection for the whole command stream
+        # instead of paying a handshake per WebDriver command
+        driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
+
+        # Explicit waits only - make sure no implicit wait sneaks in
+        driver.implicitly_wait(0)
+
+        # Selenium's default urllib3 pool holds a single connection, so any
+        # helper thread issuing a command serializes behind the main stream
+        # and logs "connection pool is full" warnings. Widen it.
+        executor = driver.command_executor
+        if hasattr(executor, "_conn"):
+            timeout = getattr(getattr(executor, "_client_config", None), "timeout", None)
+            executor._conn = urllib3.PoolManager(maxsize=10, timeout=timeout)
+
+        # Drop analytics/telemetry and asset requests at the network layer
+        blocked = self.settings.blocked_url_patterns
+        if blocked:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked})
+            except WebDriverException as e:
+                logger.debug(f"Could not set CDP URL blocklist: {e}")
+
         # Remove webdriver flag
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
+
         return driver
     
     def connect(self) -> bool:
@@ -129,11 +310,10 @@ class WIDCollector(BaseCollector):
             logger.info(f"Connecting to WID at {self.settings.base_url}")
             
             self.driver = self._setup_driver()
-            self.wait = WebDriverWait(self.driver, 20)
-            
+            self.wait = WebDriverWait(self.driver, 20, poll_frequency=0.25)
+
             # Navigate to login page
             self.driver.get(self.settings.base_url)
-            time.sleep(2)  # Wait for page load
             
             # Perform login
             if not self._login():
@@ -170,16 +350,22 @@ class WIDCollector(BaseCollector):
                 return False
             
             # Click login button
+            login_url = self.driver.current_url
             login_button = self._find_element_flexible(self.SELECTORS["login_button"])
             if login_button:
                 login_button.click()
             else:
                 # Try pressing Enter instead
                 password_input.send_keys(Keys.RETURN)
-            
-            # Wait for page to load after login
-            time.sleep(3)
-            
+
+            # Wait for the post-login page (URL change or the search menu entry)
+            try:
+                self.wait.until(EC.url_changes(login_url))
+            except TimeoutException:
+                self.wait.until(
+                    EC.presence_of_element_located((By.LINK_TEXT, "Buscar Ingeniería"))
+                )
+
             # Verify login success (check if we're not on login page anymore)
             if "login" in self.driver.current_url.lower():
                 logger.error("Still on login page - login may have failed")
@@ -193,17 +379,27 @@ class WIDCollector(BaseCollector):
     
     def _find_element_flexible(self, selector_string: str, timeout: int = 10):
         """Try multiple selectors separated by comma."""
-        selectors = [s.strip() for s in selector_string.split(",")]
-        
-        for selector in selectors:
+        # A comma-separated list is already a valid grouped CSS selector, so
+        # one wait polls all alternatives at once instead of burning the full
+        # timeout per selector.
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector_string))
+            )
+        except InvalidSelectorException:
+            pass  # Non-CSS alternative in the list - fall back to trying each
+        except TimeoutException:
+            return None
+
+        for selector in [s.strip() for s in selector_string.split(",")]:
             try:
-                element = WebDriverWait(self.driver, timeout).until(
+                element = WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                 )
                 return element
-            except TimeoutException:
+            except (TimeoutException, InvalidSelectorException):
                 continue
-        
+
         return None
     
     def disconnect(self) -> None:
@@ -215,55 +411,159 @@ class WIDCollector(BaseCollector):
             self.wait = None
         self._connected = False
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    def search_by_service(self, service_id: str) -> Optional[ServiceData]:
+    def _cache_file(self, service_id: str) -> str:
+        """Path of the pickled cache entry for a service."""
+        return os.path.join(get_settings().data_dir, "wid_cache", f"{service_id}.pkl")
+
+    def _cache_ttl(self) -> float:
+        """Cache time-to-live in seconds."""
+        return self.settings.cache_ttl_hours * 3600
+
+    def _cache_get(self, service_id: str) -> Optional[ServiceData]:
+        """Return a cached ServiceData if present and within TTL."""
+        ttl = self._cache_ttl()
+
+        with _MEM_CACHE_LOCK:
+            entry = _MEM_CACHE.get(service_id)
+            if entry:
+                if time.time() - entry[0] < ttl:
+                    _MEM_CACHE.move_to_end(service_id)
+                    return entry[1]
+                del _MEM_CACHE[service_id]  # Stale - don't keep it around
+
+        path = self._cache_file(service_id)
+        try:
+            mtime = os.path.getmtime(path)
+            if time.time() - mtime >= ttl:
+                return None
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        # EOFError: truncated file; AttributeError: pickled class moved/renamed
+        except (OSError, EOFError, AttributeError, pickle.PickleError):
+            return None
+
+        self._mem_cache_put(service_id, mtime, data)
+        return data
+
+    @staticmethod
+    def _mem_cache_put(service_id: str, stored_at: float, data: ServiceData) -> None:
+        """Insert into the in-memory tier, evicting the least recently used."""
+        with _MEM_CACHE_LOCK:
+            _MEM_CACHE[service_id] = (stored_at, data)
+            _MEM_CACHE.move_to_end(service_id)
+            while len(_MEM_CACHE) > _MEM_CACHE_MAXSIZE:
+                _MEM_CACHE.popitem(last=False)
+
+    def _cache_put(self, service_id: str, data: ServiceData) -> None:
+        """Store a fresh result in both cache tiers."""
+        self._mem_cache_put(service_id, time.time(), data)
+
+        # Write via temp file + atomic rename so a process killed mid-write
+        # can't leave a truncated .pkl that poisons the id until deleted
+        path = self._cache_file(service_id)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PickleError) as e:
+            logger.debug(f"Could not write WID cache for {service_id}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def search_by_service(
+        self,
+        service_id: str,
+        force_refresh: bool = False,
+        collected_at: Optional[datetime] = None,
+    ) -> Optional[ServiceData]:
         """
         Search for a specific service by Número de Enlace.
-        
+
         Args:
             service_id: The service identifier (Número Enlace)
-            
+            force_refresh: Bypass the cache and re-scrape
+            collected_at: Timestamp to record (defaults to now; bulk callers
+                pass one timestamp per batch)
+
         Returns:
             ServiceData object or None if not found
         """
+        if not force_refresh:
+            cached = self._cache_get(service_id)
+            if cached is not None:
+                logger.debug(f"Cache hit for service {service_id}")
+                return cached
+
+        raw_data = self._search_raw(service_id)
+
+        if raw_data:
+            data = self._map_to_service_data(service_id, raw_data, collected_at)
+            self._cache_put(service_id, data)
+            return data
+
+        return None
+
+    # Only transient glitches (stale DOM after an ajax update, a wait that
+    # just missed) are worth retrying, and they recover in well under a
+    # second - exponential backoff only added dead time before failure.
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_fixed(0.5),
+        retry=retry_if_exception_type((TimeoutException, StaleElementReferenceException)),
+    )
+    def _search_raw(self, service_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Drive the browser to a service's detail page and return its raw
+        attribute dict. Returns plain Python data only, so mapping can run
+        off the WebDriver thread (see search_many).
+        """
         if not self.is_connected:
             logger.error("Not connected to WID")
             return None
-        
+
         logger.info(f"Searching for service: {service_id}")
-        
+
         try:
             # Navigate to search page
             self._navigate_to_search()
-            
+
             # Enter service ID and search
             service_input = self._find_element_flexible(self.SELECTORS["service_number_input"])
             if service_input:
                 service_input.clear()
                 service_input.send_keys(service_id)
-                
+
                 # Click search or press Enter
                 search_btn = self._find_element_flexible(self.SELECTORS["search_button"])
                 if search_btn:
                     search_btn.click()
                 else:
                     service_input.send_keys(Keys.RETURN)
-                
-                time.sleep(2)  # Wait for results
-            
+
+                # Wait for the results table to render
+                try:
+                    self.wait.until(
+                        EC.visibility_of_element_located(
+                            (By.CSS_SELECTOR, ".ui-datatable-data tr")
+                        )
+                    )
+                except TimeoutException:
+                    pass  # No results - handled below
+
             # Check for results and navigate to detail
             if not self._click_first_result():
                 logger.warning(f"No results found for service {service_id}")
                 return None
-            
+
             # Extract data from detail page
-            raw_data = self._extract_detail_data()
-            
-            if raw_data:
-                return self._map_to_service_data(service_id, raw_data)
-            
-            return None
-            
+            return self._extract_detail_data()
+
         except Exception as e:
             logger.error(f"Error searching for service {service_id}: {e}")
             raise
@@ -306,26 +606,28 @@ class WIDCollector(BaseCollector):
         try:
             search_link = self.driver.find_element(By.LINK_TEXT, "Buscar Ingeniería")
             search_link.click()
-            time.sleep(1)
-        except NoSuchElementException:
+            # Wait for the search form to be ready
+            self.wait.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "input[id*='nroServicio'], input[id*='numeroEnlace']")
+                )
+            )
+        except (NoSuchElementException, TimeoutException):
             # Already on search page or different navigation needed
             pass
     
     def _click_first_result(self) -> bool:
         """Click on the first result to go to detail page."""
         try:
-            # Wait for results table
-            time.sleep(1)
-            
             # Find result rows
             rows = self.driver.find_elements(By.CSS_SELECTOR, ".ui-datatable-data tr")
-            
+
             if not rows:
                 return False
-            
+
             # Click on first row or detail link
             first_row = rows[0]
-            
+
             # Try to find a detail link in the row
             try:
                 detail_link = first_row.find_element(By.CSS_SELECTOR, "a")
@@ -333,76 +635,219 @@ class WIDCollector(BaseCollector):
             except NoSuchElementException:
                 # Click on the row itself
                 first_row.click()
-            
-            time.sleep(2)  # Wait for detail page to load
-            
+
+            # The clicked row goes stale on a real navigation, but PrimeFaces
+            # may render the detail in-place instead - probe briefly rather
+            # than burning the full shared timeout on the in-place case
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.25).until(
+                    EC.staleness_of(first_row)
+                )
+            except TimeoutException:
+                pass  # Detail rendered in-place (PrimeFaces ajax update)
+
             # Click on "Detalle" tab if present
             try:
                 detail_tab = self.driver.find_element(By.LINK_TEXT, "Detalle")
                 detail_tab.click()
-                time.sleep(1)
             except NoSuchElementException:
                 pass
-            
+
+            # Wait for the attribute groups - generic tables also exist on
+            # the results page, so they prove nothing about the detail view
+            self.wait.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, self.SELECTORS["attribute_groups"])
+                )
+            )
+
             return True
             
         except Exception as e:
             logger.error(f"Error clicking result: {e}")
             return False
     
+    # Collects every name/value row from the attribute tables (Grupo 1/2/3)
+    # in-browser, so the whole page costs one WebDriver command instead of
+    # one roundtrip per table/row/cell. Labels are stripped and uppercased
+    # in-page so the returned payload is final - no per-value cleanup (and
+    # no layout-flushing .text reads) on the Python side.
+    _EXTRACT_SCRIPT = """
+        const t0 = performance.now();
+        const out = {};
+        document.querySelectorAll('table tr').forEach(r => {
+            const c = r.querySelectorAll('td');
+            if (c.length >= 2) {
+                const k = c[0].innerText.trim().toUpperCase();
+                const v = c[1].innerText.trim();
+                if (k && v && v !== 'N/A') out[k] = v;
+            }
+        });
+        return {data: out, ms: performance.now() - t0};
+    """
+
     def _extract_detail_data(self) -> Dict[str, Any]:
         """Extract all attribute data from detail page."""
         raw_data = {}
-        
+
+        try:
+            result = self.driver.execute_script(self._EXTRACT_SCRIPT) or {}
+            raw_data = result.get("data") or {}
+            logger.debug(
+                f"Extracted {len(raw_data)} attributes from detail page "
+                f"in {result.get('ms', 0):.1f}ms in-page"
+            )
+
+        except WebDriverException as e:
+            logger.warning(f"In-page extraction failed, falling back to element traversal: {e}")
+            raw_data = self._extract_detail_data_slow()
+        except Exception as e:
+            logger.error(f"Error extracting detail data: {e}")
+
+        return raw_data
+
+    def _extract_detail_data_slow(self) -> Dict[str, Any]:
+        """Element-by-element fallback when script injection is unavailable."""
+        raw_data = {}
+
         try:
-            # Find all tables with attributes (Grupo 1, Grupo 2, Grupo 3)
-            # Based on screenshot, attributes are in tables under each group
-            
             tables = self.driver.find_elements(By.CSS_SELECTOR, "table")
-            
+
             for table in tables:
                 rows = table.find_elements(By.CSS_SELECTOR, "tr")
-                
+
                 for row in rows:
-                    cells = row.find_elements(By.CSS_SELECTOR, "td")
-                    
+                    # Only the name and value cells matter - one grouped query
+                    # instead of transporting every td in the row. Second cell
+                    # (not last) to mirror the in-page script's c[1] read.
+                    cells = row.find_elements(
+                        By.CSS_SELECTOR, "td:first-child, td:nth-child(2)"
+                    )
+
                     if len(cells) >= 2:
                         attr_name = cells[0].text.strip().upper()
                         attr_value = cells[1].text.strip()
-                        
+
                         if attr_name and attr_value and attr_value != "N/A":
                             raw_data[attr_name] = attr_value
-            
+
             logger.debug(f"Extracted {len(raw_data)} attributes from detail page")
-            
+
         except Exception as e:
             logger.error(f"Error extracting detail data: {e}")
-        
+
         return raw_data
     
-    def _map_to_service_data(self, service_id: str, raw_data: Dict[str, Any]) -> ServiceData:
+    @classmethod
+    def search_many(cls, service_ids: List[str], pool_size: int = None) -> List[Optional[ServiceData]]:
+        """
+        Look up many services in parallel using a pool of browsers.
+
+        Args:
+            service_ids: Service identifiers to fetch
+            pool_size: Number of parallel browsers (defaults to WID_POOL_SIZE)
+
+        Returns:
+            ServiceData (or None) per service_id, in input order
+        """
+        pool = WIDDriverPool(size=pool_size)
+        batch_ts = datetime.now()  # One clock read for the whole batch
+
+        # Workers only drive browsers and hand back plain dicts; mapping and
+        # cache writes happen on this thread while the next services are
+        # still being scraped, so drivers are never blocked on CPython work.
+        def fetch(service_id: str):
+            collector = pool.acquire()
+            try:
+                cached = collector._cache_get(service_id)
+                if cached is not None:
+                    return cached
+                return collector._search_raw(service_id)
+            except Exception as e:
+                logger.error(f"Bulk lookup failed for service {service_id}: {e}")
+                return None
+            finally:
+                pool.release(collector)
+
+        mapper = cls()  # Driverless instance for mapping and cache writes
+        results: List[Optional[ServiceData]] = []
+
+        try:
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                for service_id, outcome in zip(service_ids, executor.map(fetch, service_ids)):
+                    if isinstance(outcome, ServiceData) or outcome is None:
+                        results.append(outcome)
+                    elif outcome:
+                        data = mapper._map_to_service_data(service_id, outcome, batch_ts)
+                        mapper._cache_put(service_id, data)
+                        results.append(data)
+                    else:
+                        results.append(None)
+        finally:
+            pool.close()
+
+        return results
+
+    def _map_to_service_data(
+        self,
+        service_id: str,
+        raw_data: Dict[str, Any],
+        collected_at: Optional[datetime] = None,
+    ) -> ServiceData:
         """Map raw WID data to standardized ServiceData."""
-        
-        data = ServiceData(
-            service_id=service_id,
-            source_system="WID",
-            raw_data=raw_data
+        return _build_service_data(
+            service_id, raw_data, self._FIELD_MAP_ACTIVE, collected_at
         )
-        
-        for wid_field, service_field in self.FIELD_MAPPING.items():
-            if service_field and wid_field in raw_data:
-                value = raw_data[wid_field]
-                
-                # Type conversion for numeric fields
-                if service_field in ["bandwidth", "cpe_management_vlan", "cpe_interface_vlan", "bvi_vlan"]:
-                    try:
-                        value = int(re.sub(r'[^\d]', '', str(value)))
-                    except ValueError:
-                        value = None
-                
-                setattr(data, service_field, value)
-        
-        return data
+
+
+class WIDDriverPool:
+    """
+    Pool of pre-authenticated WIDCollector instances for parallel scrapes.
+
+    Each collector owns its own Chrome session, so up to `size` lookups can
+    run concurrently. Collectors are checked out with acquire() and must be
+    returned with release().
+    """
+
+    def __init__(self, size: int = None, headless: bool = None):
+        self.size = size if size is not None else get_settings().wid.pool_size
+        self._pool: "queue.Queue[WIDCollector]" = queue.Queue(maxsize=self.size)
+
+        logger.info(f"Starting WID driver pool with {self.size} browsers")
+        connected: List[WIDCollector] = []
+        try:
+            for _ in range(self.size):
+                collector = WIDCollector(headless=headless)
+                if not collector.connect():
+                    # connect() can fail after the browser started (bad
+                    # login) - make sure its Chrome dies too
+                    collector.disconnect()
+                    raise ConnectionError("Failed to connect a pooled WID collector")
+                connected.append(collector)
+        except Exception:
+            # Don't orphan the browsers that did come up
+            for collector in connected:
+                collector.disconnect()
+            raise
+
+        for collector in connected:
+            self._pool.put(collector)
+
+    def acquire(self) -> WIDCollector:
+        """Check out a collector, blocking until one is free."""
+        return self._pool.get()
+
+    def release(self, collector: WIDCollector) -> None:
+        """Return a collector to the pool."""
+        self._pool.put(collector)
+
+    def close(self) -> None:
+        """Disconnect every pooled collector."""
+        while True:
+            try:
+                self._pool.get_nowait().disconnect()
+            except queue.Empty:
+                break
 
 
 # Convenience function for quick usage
@@ -414,5 +859,5 @@ def get_service_from_wid(service_id: str) -> Optional[ServiceData]:
         from collectors.wid_collector import get_service_from_wid
         service = get_service_from_wid("14815103")
     """
-    with WIDCollector() as collector:
-        return collector.search_by_service(service_id)
+    collector = WIDCollector.get_shared()
+    return collector.search_by_service(service_id)
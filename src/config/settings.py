@@ -5,8 +5,8 @@ Uses pydantic-settings for environment variable management.
 
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Optional
-from functools import lru_cache
+from typing import List, Optional
+from functools import cached_property, lru_cache
 
 
 class WIDSettings(BaseSettings):
@@ -14,6 +14,22 @@ class WIDSettings(BaseSettings):
     base_url: str = Field(default="https://wid.claro.com.ar", alias="WID_BASE_URL")
     username: str = Field(default="", alias="WID_USERNAME")
     password: str = Field(default="", alias="WID_PASSWORD")
+    pool_size: int = Field(default=4, alias="WID_POOL_SIZE")
+    cache_ttl_hours: float = Field(default=24.0, alias="WID_CACHE_TTL_HOURS")
+    # URL patterns dropped at the network layer via CDP (JSON list in env)
+    blocked_url_patterns: List[str] = Field(
+        default=[
+            "*google-analytics*",
+            "*googletagmanager*",
+            "*.woff",
+            "*.woff2",
+            "*.ttf",
+            "*.png",
+            "*.jpg",
+            "*.gif",
+        ],
+        alias="WID_BLOCKED_URLS",
+    )
     
     class Config:
         env_file = ".env"
@@ -58,16 +74,28 @@ class AppSettings(BaseSettings):
     headless_browser: bool = Field(default=True, alias="HEADLESS_BROWSER")
     data_dir: str = Field(default="data")
     
-    # Sub-settings
-    wid: WIDSettings = Field(default_factory=WIDSettings)
-    jarvis: JarvisSettings = Field(default_factory=JarvisSettings)
-    sap: SAPSettings = Field(default_factory=SAPSettings)
-    flowone: FlowoneSettings = Field(default_factory=FlowoneSettings)
-    
     class Config:
         env_file = ".env"
         extra = "ignore"
 
+    # Sub-settings, built lazily so a script that only touches one system
+    # doesn't pay the .env/environment scan for the other three
+    @cached_property
+    def wid(self) -> WIDSettings:
+        return WIDSettings()
+
+    @cached_property
+    def jarvis(self) -> JarvisSettings:
+        return JarvisSettings()
+
+    @cached_property
+    def sap(self) -> SAPSettings:
+        return SAPSettings()
+
+    @cached_property
+    def flowone(self) -> FlowoneSettings:
+        return FlowoneSettings()
+
 
 @lru_cache()
 def get_settings() -> AppSettings:
@@ -12,6 +12,7 @@ Example:
 
 import sys
 import os
+from dataclasses import fields
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -55,10 +56,14 @@ def test_service_search(service_id: str):
             print("SERVICE DATA EXTRACTED:")
             print("="*50)
             
-            # Print all non-None fields
-            for field, value in vars(service).items():
-                if value is not None and field not in ['raw_data', 'collected_at']:
-                    print(f"  {field}: {value}")
+            # Print all non-None fields (ordered dataclass metadata,
+            # no vars() dict copy)
+            for f in fields(service):
+                if f.name in ('raw_data', 'collected_at'):
+                    continue
+                value = getattr(service, f.name)
+                if value is not None:
+                    print(f"  {f.name}: {value}")
             
             print("\n" + "-"*50)
             print("RAW DATA FROM WID:")